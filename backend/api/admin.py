@@ -1,15 +1,104 @@
 from django.contrib import admin
+from django.core.cache import cache
+from django.db.models import Count
 from .models import *
+from .pagination import EstimatedCountPaginator
+
+EXACT_COUNT_VAR = 'exact_count'
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist for tables with millions of rows: estimated counts
+    (append ?exact_count=1 for a real one), key-seek pagination and no
+    second COUNT(*) for the "N total" link.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def changelist_view(self, request, extra_context=None):
+        # Strip our flag before ChangeList treats it as an unknown lookup.
+        request.exact_count = EXACT_COUNT_VAR in request.GET
+        if request.exact_count:
+            request.GET = request.GET.copy()
+            del request.GET[EXACT_COUNT_VAR]
+        return super().changelist_view(request, extra_context)
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        paginator = super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        paginator.exact = getattr(request, 'exact_count', False)
+        return paginator
+
+
+def status_action(status, label):
+    def action(modeladmin, request, queryset):
+        # One UPDATE (plus one batched log INSERT) for the whole selection.
+        updated = queryset.set_status(status, changed_by=request.user)
+        modeladmin.message_user(request, f"{updated} registration(s) marked as {label.lower()}.")
+    action.__name__ = f"mark_{status}"
+    return admin.action(description=f"Mark selected as {label.lower()}")(action)
+
+
+class ExhibitorStatusTransitionInline(admin.TabularInline):
+    model = ExhibitorStatusTransition
+    fields = ('from_status', 'to_status', 'changed_by', 'changed_at')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(ExhibitorRegistration)
-class ExhibitorRegistrationAdmin(admin.ModelAdmin):
-    list_display = ('company_name','contact_person_name','email_address','contact_number','product_service','created_at')
+class ExhibitorRegistrationAdmin(LargeTableAdmin):
+    list_display = ('company_name','contact_person_name','email_address','contact_number','product_service','status','created_at')
+    list_filter = ('status', ('created_at', admin.DateFieldListFilter))
+    search_fields = ExhibitorRegistration.SEARCH_FIELDS
     readonly_fields = ('created_at','updated_at')
     ordering = ('-created_at',)
+    actions = [status_action(value, label) for value, label in ExhibitorRegistration.STATUS_CHOICES]
+    inlines = [ExhibitorStatusTransitionInline]
+
+    def save_model(self, request, obj, form, change):
+        obj.status_changed_by = request.user
+        super().save_model(request, obj, form, change)
+
+class IndustryListFilter(admin.SimpleListFilter):
+    """
+    `industry` is free text, so the stock filter would SELECT DISTINCT over
+    the whole table on every changelist load. Offer the most common values
+    instead, recomputed at most once per `timeout` from the shared cache.
+    """
+    title = 'industry'
+    parameter_name = 'industry'
+    cache_key = 'admin:visitor-industries'
+    limit = 50
+    timeout = 3600
+
+    def lookups(self, request, model_admin):
+        industries = cache.get(self.cache_key)
+        if industries is None:
+            common = (
+                model_admin.model.objects.values('industry')
+                .annotate(total=Count('pk'))
+                .order_by('-total')[:self.limit]
+            )
+            industries = sorted(row['industry'] for row in common)
+            cache.set(self.cache_key, industries, self.timeout)
+        return [(industry, industry) for industry in industries]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(industry=self.value())
+        return queryset
+
 
 @admin.register(VistorRegistration)
-class VistorRegistrationAdmin(admin.ModelAdmin):
+class VistorRegistrationAdmin(LargeTableAdmin):
     list_display = ('First_name','Last_name','company_name','email_address','contact_number','industry','created_at')
+    list_filter = (IndustryListFilter, ('created_at', admin.DateFieldListFilter))
+    search_fields = VistorRegistration.SEARCH_FIELDS
     readonly_fields = ('created_at','updated_at')
     ordering = ('-created_at',)
 
@@ -0,0 +1,144 @@
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from .models import ExhibitorStatusTransition
+
+FUNNEL_CACHE_TIMEOUT = 300
+FUNNEL_DEFAULT_WINDOW = timedelta(days=90)
+
+# The cohort is every registration created (its '' -> pending row) inside
+# [since, until); only its transitions inside the same window are read.
+# Both filters are on changed_at, so the BRIN index prunes the scan to
+# the window no matter how much history has accumulated.
+_HISTORY_CTE = """
+    WITH cohort AS (
+        SELECT registration_id
+        FROM {table}
+        WHERE from_status = '' AND changed_at >= %(since)s AND changed_at < %(until)s
+    ),
+    history AS (
+        SELECT t.id, t.registration_id, t.to_status, t.changed_by_id, t.changed_at,
+               LAG(t.changed_at) OVER w AS entered_at,
+               LEAD(t.changed_at) OVER w AS left_at
+        FROM {table} t
+        JOIN cohort c ON c.registration_id = t.registration_id
+        WHERE t.changed_at >= %(since)s AND t.changed_at < %(until)s
+        WINDOW w AS (PARTITION BY t.registration_id ORDER BY t.changed_at, t.id)
+    )
+"""
+
+# Reach is cumulative: a registration marked paid straight from pending
+# still counts as contacted, so every ratio stays within [0, 1].
+_REACH_SQL = _HISTORY_CTE + """
+    SELECT COUNT(DISTINCT registration_id),
+           COUNT(DISTINCT registration_id) FILTER (WHERE to_status IN ('contacted', 'paid')),
+           COUNT(DISTINCT registration_id) FILTER (WHERE to_status = 'paid'),
+           COUNT(DISTINCT registration_id) FILTER (WHERE to_status = 'rejected')
+    FROM history
+"""
+
+# Time in a stage is the gap to the registration's next transition.
+_STAGE_SQL = _HISTORY_CTE + """
+    SELECT to_status,
+           percentile_cont(0.5) WITHIN GROUP (
+               ORDER BY EXTRACT(EPOCH FROM left_at - changed_at)
+           )
+    FROM history
+    GROUP BY to_status
+"""
+
+# Per user who made the change; time to contact is the gap since the
+# registration's previous transition.
+_USER_SQL = _HISTORY_CTE + """
+    SELECT u.id, u.name, u.username, u.role,
+           COUNT(*) FILTER (WHERE h.to_status = 'contacted'),
+           COUNT(*) FILTER (WHERE h.to_status = 'paid'),
+           COUNT(*) FILTER (WHERE h.to_status = 'rejected'),
+           percentile_cont(0.5) WITHIN GROUP (
+               ORDER BY EXTRACT(EPOCH FROM h.changed_at - h.entered_at)
+           ) FILTER (WHERE h.to_status = 'contacted')
+    FROM history h
+    JOIN {user_table} u ON u.id = h.changed_by_id
+    GROUP BY u.id, u.name, u.username, u.role
+    ORDER BY u.name, u.username
+"""
+
+
+def _hours(seconds):
+    return None if seconds is None else round(seconds / 3600, 2)
+
+
+def _rate(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+def default_funnel_window():
+    """(since, until) dates: the last FUNNEL_DEFAULT_WINDOW, today included."""
+    until = timezone.localdate() + timedelta(days=1)
+    return until - FUNNEL_DEFAULT_WINDOW, until
+
+
+def compute_exhibitor_funnel(since, until):
+    table = connection.ops.quote_name(ExhibitorStatusTransition._meta.db_table)
+    user_table = connection.ops.quote_name(
+        ExhibitorStatusTransition._meta.get_field('changed_by').related_model._meta.db_table
+    )
+    params = {
+        'since': timezone.make_aware(datetime.combine(since, time.min)),
+        'until': timezone.make_aware(datetime.combine(until, time.min)),
+    }
+
+    with connection.cursor() as cursor:
+        cursor.execute(_REACH_SQL.format(table=table), params)
+        created, contacted, paid, rejected = cursor.fetchone()
+
+        cursor.execute(_STAGE_SQL.format(table=table), params)
+        medians = dict(cursor.fetchall())
+
+        cursor.execute(_USER_SQL.format(table=table, user_table=user_table), params)
+        users = cursor.fetchall()
+
+    reached = {'pending': created, 'contacted': contacted, 'paid': paid, 'rejected': rejected}
+
+    return {
+        'since': since.isoformat(),
+        'until': until.isoformat(),
+        'stages': [
+            {
+                'status': status,
+                'reached': count,
+                'median_hours_in_stage': _hours(medians.get(status)),
+            }
+            for status, count in reached.items()
+        ],
+        'conversion': {
+            'pending_to_contacted': _rate(contacted, created),
+            'contacted_to_paid': _rate(paid, contacted),
+            'pending_to_paid': _rate(paid, created),
+            'rejection_rate': _rate(rejected, created),
+        },
+        'by_user': [
+            {
+                'id': user_id,
+                'name': name or username,
+                'role': role,
+                'contacted': contacted_count,
+                'paid': paid_count,
+                'rejected': rejected_count,
+                'median_hours_to_contact': _hours(median),
+            }
+            for user_id, name, username, role, contacted_count, paid_count, rejected_count, median in users
+        ],
+    }
+
+
+def exhibitor_funnel(since, until):
+    """Funnel for registrations created in [since, until), cached per window."""
+    return cache.get_or_set(
+        f'analytics:exhibitor-funnel:{since.isoformat()}:{until.isoformat()}',
+        lambda: compute_exhibitor_funnel(since, until),
+        FUNNEL_CACHE_TIMEOUT,
+    )
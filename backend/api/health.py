@@ -0,0 +1,97 @@
+import logging
+import uuid
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.urls import get_resolver
+
+from .site_bundle import get_site_bundle
+
+logger = logging.getLogger(__name__)
+
+STORAGE_CHECK_CACHE_KEY = 'health:storage'
+STORAGE_CHECK_TIMEOUT = 60
+STORAGE_PROBE_TIMEOUT = 3
+
+
+# -------------------------------------------------------
+# Readiness checks
+# -------------------------------------------------------
+def check_database():
+    for alias in connections:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+
+def check_cache():
+    key = f'health:cache:{uuid.uuid4().hex}'
+    cache.set(key, 1, 10)
+    if cache.get(key) != 1:
+        raise RuntimeError("cache round-trip failed")
+    cache.delete(key)
+
+
+def check_storage():
+    # HEAD the public media endpoint rather than asking S3 through boto3,
+    # so readiness probes don't pull boto3/botocore into every fresh worker.
+    # Any answer below 500 (a 403/404 for the probe key included) means
+    # the bucket is reachable. One success per minute is enough.
+    if cache.get(STORAGE_CHECK_CACHE_KEY):
+        return
+    probe = Request(urljoin(settings.MEDIA_URL, '.healthcheck'), method='HEAD')
+    try:
+        urlopen(probe, timeout=STORAGE_PROBE_TIMEOUT).close()
+    except HTTPError as exc:
+        if exc.code >= 500:
+            raise
+    cache.set(STORAGE_CHECK_CACHE_KEY, True, STORAGE_CHECK_TIMEOUT)
+
+
+READINESS_CHECKS = {
+    'database': check_database,
+    'cache': check_cache,
+    'storage': check_storage,
+}
+
+
+def readiness():
+    """Run every check; returns (all_ok, {name: "ok" | "error"})."""
+    results = {}
+    for name, check in READINESS_CHECKS.items():
+        try:
+            check()
+            results[name] = 'ok'
+        except Exception as exc:
+            # Details go to the log only; the probe endpoint is public.
+            logger.warning("Readiness check %s failed: %s", name, exc)
+            results[name] = 'error'
+    return all(v == 'ok' for v in results.values()), results
+
+
+# -------------------------------------------------------
+# Warm-up for fresh workers
+# -------------------------------------------------------
+def warm_up():
+    """
+    Pay first-request costs before the worker takes traffic: open the DB
+    connection(s), build the URL resolver and prime the site-bundle cache.
+    S3 is left lazy on purpose. Called from config/wsgi.py; never raises.
+
+    Do not combine with `gunicorn --preload`: connections opened here
+    would be shared by the forked workers.
+    """
+    steps = [
+        ('database', lambda: [connections[alias].ensure_connection() for alias in connections]),
+        ('cache', lambda: cache.get('health:warm-up')),
+        ('urls', lambda: get_resolver().url_patterns),
+        ('site bundle', get_site_bundle),
+    ]
+    for name, step in steps:
+        try:
+            step()
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
@@ -0,0 +1,60 @@
+import logging
+import threading
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection as db_connection, transaction
+from django.utils import timezone
+
+from .models import PasswordSetupToken
+
+logger = logging.getLogger(__name__)
+
+
+def invitation_email(name, email, token):
+    setup_link = f"https://yourdomain.com/create-password?token={token}"
+    return (
+        "Set Your Password",
+        f"Hello {name},\nUse the link below to set your password:\n{setup_link}\n(This link expires in 1 hour.)",
+        "no-reply@yourapp.com",
+        [email],
+    )
+
+
+def deliver_invitations(tokens):
+    """
+    Send the invitation for each token over one SMTP connection and stamp
+    `invite_sent_at` on the ones that went out. Failures are logged with
+    their recipients and left unstamped for `manage.py resend_invites`.
+    Returns the number sent.
+    """
+    sent = []
+    try:
+        with get_connection() as mail_connection:
+            for token in tokens:
+                subject, body, sender, recipients = invitation_email(token.user.name, token.user.email, token.token)
+                try:
+                    EmailMessage(subject, body, sender, recipients, connection=mail_connection).send()
+                    sent.append(token.pk)
+                except Exception:
+                    logger.exception("Failed to send invitation email to %s", ", ".join(recipients))
+    except Exception:
+        logger.exception(
+            "Mail connection failed; invitations not sent to %s",
+            ", ".join(token.user.email for token in tokens if token.pk not in sent),
+        )
+    finally:
+        if sent:
+            PasswordSetupToken.objects.filter(pk__in=sent).update(invite_sent_at=timezone.now())
+    return len(sent)
+
+
+def enqueue_invitations(tokens):
+    # Send once the users exist, off the request thread. Anything lost to
+    # a failure or a worker restart stays unstamped and is re-sent later.
+    def run():
+        try:
+            deliver_invitations(tokens)
+        finally:
+            db_connection.close()
+
+    transaction.on_commit(lambda: threading.Thread(target=run, daemon=True).start())
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.site_bundle import SITE_BUNDLE_FILE, cache_is_shared, refresh_site_bundle
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute the public site bundle (events, categories, gallery) into the "
+        "cache and publish it as static JSON on storage. Schedule it (cron), e.g. every 5 minutes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-publish', action='store_true',
+                            help="Only refresh the cache, don't write the static file.")
+
+    def handle(self, *args, **options):
+        if not cache_is_shared():
+            # The bundle would land in this command's own memory and be
+            # thrown away on exit; the web workers would never see it.
+            raise CommandError(
+                "The default cache is process-local; configure REDIS_URL or the "
+                "database cache (createcachetable) before running this command."
+            )
+        payload = refresh_site_bundle(publish=not options['no_publish'])
+        target = "cache" if options['no_publish'] else f"cache and {SITE_BUNDLE_FILE}"
+        self.stdout.write(self.style.SUCCESS(f"Site bundle ({len(payload)} bytes) written to {target}."))
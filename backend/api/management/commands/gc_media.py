@@ -0,0 +1,89 @@
+import posixpath
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import Category, GalleryImage
+
+# (model, field) pairs whose files live on the content-addressed storage.
+MEDIA_FIELDS = [
+    (GalleryImage, 'image'),
+    (Category, 'image'),
+]
+
+
+class Command(BaseCommand):
+    help = "Delete media objects on S3 that no GalleryImage/Category row references."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Rows per reference-scan query and keys per delete call (max 1000).")
+        parser.add_argument('--min-age-hours', type=int, default=24,
+                            help="Skip objects newer than this, so in-flight uploads are never collected.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report what would be deleted.")
+
+    def handle(self, *args, **options):
+        batch_size = min(options['batch_size'], 1000)
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+
+        referenced = set()
+        prefixes = set()
+        for model, field_name in MEDIA_FIELDS:
+            prefixes.add(model._meta.get_field(field_name).upload_to)
+            names = (
+                model.objects.exclude(**{field_name: ''})
+                .exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True)
+                .iterator(chunk_size=batch_size)
+            )
+            referenced.update(names)
+
+        bucket = default_storage.backend.bucket
+        location = default_storage.backend.location
+        deleted = 0
+
+        for prefix in sorted(prefixes):
+            key_prefix = posixpath.join(location, prefix) if location else prefix
+            batch = {}
+            for obj in bucket.objects.filter(Prefix=key_prefix):
+                name = posixpath.relpath(obj.key, location) if location else obj.key
+                if name in referenced or obj.last_modified >= cutoff:
+                    continue
+                batch[name] = obj.key
+                if len(batch) >= batch_size:
+                    deleted += self.delete(bucket, batch, options['dry_run'])
+                    batch = {}
+            if batch:
+                deleted += self.delete(bucket, batch, options['dry_run'])
+
+        verb = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {deleted} unreferenced object(s); {len(referenced)} referenced."
+        ))
+
+    def delete(self, bucket, batch, dry_run):
+        # The reference scan above can be minutes old by now: a row saved
+        # since then may point at one of these keys (an identical re-upload
+        # reuses the existing object), so check this batch again right
+        # before deleting.
+        for model, field_name in MEDIA_FIELDS:
+            for name in model.objects.filter(
+                **{f'{field_name}__in': list(batch)}
+            ).values_list(field_name, flat=True):
+                batch.pop(name, None)
+
+        keys = list(batch.values())
+        if not keys:
+            return 0
+        if dry_run:
+            for key in keys:
+                self.stdout.write(f"  {key}")
+        else:
+            bucket.delete_objects(Delete={
+                'Objects': [{'Key': key} for key in keys],
+                'Quiet': True,
+            })
+        return len(keys)
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Run in a fresh interpreter so nothing is already imported. The child
+# gets WARM_UP_ON_START=False so the import is measured alone; warm-up is
+# then timed as its own step, as a worker would run it before traffic.
+# The optional request goes straight through the WSGI callable, no server
+# involved.
+_SCRIPT = """
+import sys, time
+from wsgiref.util import setup_testing_defaults
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+if {warm_up!r}:
+    from api.health import warm_up
+    warm_up()
+ready = time.perf_counter()
+if {path!r}:
+    environ = {{'PATH_INFO': {path!r}}}
+    setup_testing_defaults(environ)
+    {module}.application(environ, lambda status, headers: None)
+done = time.perf_counter()
+print(f"{{imported - start}} {{ready - imported}} {{done - ready}}")
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile cold start: import the WSGI app in a fresh interpreter with "
+        "`python -X importtime`, optionally serve one request, and report the slowest imports."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--module', default='config.wsgi',
+                            help="Module to import (default: config.wsgi).")
+        parser.add_argument('--path', default='',
+                            help="Also time a first request to this path, e.g. /api/health/ready/.")
+        parser.add_argument('--top', type=int, default=20,
+                            help="How many modules/packages to list.")
+        parser.add_argument('--no-warm-up', action='store_true',
+                            help="Skip warm_up(), so the first request pays for a cold worker.")
+
+    def handle(self, *args, **options):
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),
+            'WARM_UP_ON_START': 'False',
+        }
+        warm_up = not options['no_warm_up']
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c',
+             _SCRIPT.format(module=options['module'], path=options['path'], warm_up=warm_up)],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+
+        modules, packages = [], defaultdict(int)
+        errors = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:'):
+                errors.append(line)
+                continue
+            parts = line[len('import time:'):].split('|')
+            if len(parts) != 3 or not parts[0].strip().isdigit():
+                continue  # header row
+            self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2].strip()
+            modules.append((cumulative_us, name))
+            packages[name.split('.')[0]] += self_us
+
+        if proc.returncode != 0:
+            self.stderr.write("\n".join(errors))
+            return
+
+        import_s, warm_up_s, request_s = (float(v) for v in proc.stdout.split()[-3:])
+        top = options['top']
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Slowest imports (cumulative), top {top}"))
+        for cumulative_us, name in sorted(modules, reverse=True)[:top]:
+            self.stdout.write(f"  {cumulative_us / 1000:9.1f} ms  {name}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Packages by own import time, top {top}"))
+        for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            self.stdout.write(f"  {self_us / 1000:9.1f} ms  {name}")
+
+        self.stdout.write(self.style.SUCCESS(f"Import of {options['module']}: {import_s * 1000:.1f} ms"))
+        if warm_up:
+            self.stdout.write(self.style.SUCCESS(f"warm_up(): {warm_up_s * 1000:.1f} ms"))
+        if options['path']:
+            self.stdout.write(self.style.SUCCESS(f"First request to {options['path']}: {request_s * 1000:.1f} ms"))
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.invitations import deliver_invitations
+from api.models import PasswordSetupToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-send invitation emails that never went out (failed send or worker "
+        "restart) while their tokens are still valid. Meant to run periodically (cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-age-minutes', type=int, default=5,
+                            help="Skip tokens younger than this; their background send may still be running.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['min_age_minutes'])
+        pending = list(
+            PasswordSetupToken.objects.valid()
+            .filter(invite_sent_at__isnull=True, created_at__lte=cutoff)
+            .select_related('user')
+        )
+        sent = deliver_invitations(pending)
+        self.stdout.write(self.style.SUCCESS(f"Re-sent {sent} of {len(pending)} unsent invitation(s)."))
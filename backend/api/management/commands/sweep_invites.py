@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from api.models import PASSWORD_SETUP_TOKEN_LIFETIME, PasswordSetupToken
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Purge expired password-setup tokens and team members who never "
+        "activated before their invitation expired. Meant to run periodically (cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help="Rows deleted per statement.")
+        parser.add_argument('--keep-users', action='store_true',
+                            help="Only delete expired tokens, keep unactivated users.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        users = 0
+        if not options['keep_users']:
+            # Invited, never activated, and no invitation link left to use.
+            lapsed = User.objects.filter(
+                role__in=["manager", "sales"],
+                is_active=False,
+                is_password_set=False,
+                date_joined__lte=timezone.now() - PASSWORD_SETUP_TOKEN_LIFETIME,
+            ).exclude(
+                Exists(PasswordSetupToken.objects.valid().filter(user=OuterRef('pk')))
+            )
+            users = self.delete_in_batches(lapsed, batch_size)
+
+        tokens = self.delete_in_batches(PasswordSetupToken.objects.expired(), batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {tokens} expired token(s) and {users} unactivated user(s)."
+        ))
+
+    def delete_in_batches(self, queryset, batch_size):
+        total = 0
+        while True:
+            pks = list(queryset.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return total
+            queryset.model.objects.filter(pk__in=pks).delete()
+            total += len(pks)
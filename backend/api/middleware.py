@@ -0,0 +1,57 @@
+import re
+
+import brotli
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+re_accepts_br = re.compile(r"\bbr\b")
+
+
+# -------------------------------------------------------
+# Brotli for public responses, gzip otherwise
+# -------------------------------------------------------
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Brotli has no equivalent of the random gzip header padding Django uses
+    against BREACH, so it is only used where no secret can be in the body:
+    credential-less GET/HEAD requests whose response sets no cookies.
+    Everything else goes through GZipMiddleware unchanged.
+    """
+
+    min_length = 200
+    brotli_quality = 5
+
+    def process_response(self, request, response):
+        if (
+            response.streaming
+            or len(response.content) < self.min_length
+            or response.has_header("Content-Encoding")
+            or not re_accepts_br.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+            or not self.is_public(request, response)
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(response.content))
+
+        # Same as GZipMiddleware: the body changed, so a strong ETag must go weak.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
+
+    @staticmethod
+    def is_public(request, response):
+        return (
+            request.method in ("GET", "HEAD")
+            and "HTTP_AUTHORIZATION" not in request.META
+            and not request.COOKIES
+            and not response.cookies
+        )
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-19 20:01
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(fields=['-created_at', '-id'], name='exhibitor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(fields=['status', '-created_at'], name='exhibitor_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_name'), name='text_pattern_ops'), name='exhibitor_company_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(django.db.models.functions.text.Upper('email_address'), name='exhibitor_email_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vistorregistration',
+            index=models.Index(fields=['-created_at', '-id'], name='visitor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vistorregistration',
+            index=models.Index(fields=['industry', '-created_at'], name='visitor_industry_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vistorregistration',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_name'), name='text_pattern_ops'), name='visitor_company_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vistorregistration',
+            index=models.Index(django.db.models.functions.text.Upper('email_address'), name='visitor_email_upper_idx'),
+        ),
+    ]
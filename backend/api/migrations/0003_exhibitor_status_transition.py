@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-19 20:01
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_registration_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExhibitorStatusTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, max_length=20)),
+                ('to_status', models.CharField(choices=[('pending', 'Pending'), ('contacted', 'Contacted'), ('paid', 'Paid'), ('rejected', 'Rejected')], max_length=20)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['changed_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='exhibitorstatustransition',
+            name='changed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='exhibitorstatustransition',
+            name='registration',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_transitions', to='api.exhibitorregistration'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorstatustransition',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['changed_at'], name='transition_changed_brin'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorstatustransition',
+            index=models.Index(fields=['registration', 'changed_at'], name='transition_registration_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+
+def backfill_transitions(apps, schema_editor):
+    """
+    Give every registration that predates the transition log a history:
+    '' -> pending at created_at, plus pending -> <current status> at
+    updated_at (the best timestamp we have) when it has moved on.
+    """
+    Registration = apps.get_model('api', 'ExhibitorRegistration')
+    Transition = apps.get_model('api', 'ExhibitorStatusTransition')
+    quote = schema_editor.quote_name
+    registrations = quote(Registration._meta.db_table)
+    transitions = quote(Transition._meta.db_table)
+
+    untracked = f"""
+        FROM {registrations} r
+        WHERE NOT EXISTS (SELECT 1 FROM {transitions} t WHERE t.registration_id = r.id)
+    """
+    # Order matters: this one picks registrations with no history at all,
+    # which stops being true once the creation rows below exist.
+    schema_editor.execute(f"""
+        INSERT INTO {transitions} (registration_id, from_status, to_status, changed_at)
+        SELECT r.id, 'pending', r.status, r.updated_at {untracked} AND r.status <> 'pending'
+    """)
+    schema_editor.execute(f"""
+        INSERT INTO {transitions} (registration_id, from_status, to_status, changed_at)
+        SELECT r.id, '', 'pending', r.created_at
+        FROM {registrations} r
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {transitions} t
+            WHERE t.registration_id = r.id AND t.from_status = ''
+        )
+    """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_exhibitor_status_transition'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_transitions, migrations.RunPython.noop),
+    ]
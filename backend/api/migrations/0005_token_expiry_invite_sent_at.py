@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-19 20:04
+
+from datetime import timedelta
+
+import api.models
+from django.db import migrations, models
+from django.db.models import F
+
+# Frozen copy of api.models.PASSWORD_SETUP_TOKEN_LIFETIME.
+TOKEN_LIFETIME = timedelta(hours=1)
+
+
+def backfill_tokens(apps, schema_editor):
+    """
+    AddField evaluates the callable expires_at default once, giving every
+    existing token "migration time + 1h" and making old expired tokens
+    valid again. Derive it from created_at instead. Existing tokens were
+    emailed synchronously at creation, so mark them sent.
+    """
+    Token = apps.get_model('api', 'PasswordSetupToken')
+    Token.objects.update(
+        expires_at=F('created_at') + TOKEN_LIFETIME,
+        invite_sent_at=F('created_at'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_backfill_exhibitor_status_transitions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='passwordsetuptoken',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True, default=api.models.default_token_expiry),
+        ),
+        migrations.AddField(
+            model_name='passwordsetuptoken',
+            name='invite_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_tokens, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,8 @@
 import uuid
-from django.db import models
+from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, OpClass
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
 from datetime import timedelta
@@ -8,6 +11,31 @@ from datetime import timedelta
 # ---------------------------------------------------
 # EXISTING MODELS (unchanged)
 # ---------------------------------------------------
+class ExhibitorRegistrationQuerySet(models.QuerySet):
+    def set_status(self, status, changed_by=None):
+        """
+        Bulk status change: one UPDATE plus one batched INSERT into the
+        transition log, in the same transaction.
+        """
+        with transaction.atomic(using=self.db):
+            changing = self.exclude(status=status).select_for_update()
+            now = timezone.now()
+            ExhibitorStatusTransition.objects.using(self.db).bulk_create(
+                [
+                    ExhibitorStatusTransition(
+                        registration_id=pk,
+                        from_status=previous,
+                        to_status=status,
+                        changed_by=changed_by,
+                        changed_at=now,
+                    )
+                    for pk, previous in changing.values_list('pk', 'status').iterator()
+                ],
+                batch_size=1000,
+            )
+            return changing.update(status=status, updated_at=now)
+
+
 class ExhibitorRegistration(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -26,12 +54,52 @@ class ExhibitorRegistration(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Shared by the admin and the API so both hit the indexes below.
+    SEARCH_FIELDS = ('^company_name', '=email_address')
+
+    objects = ExhibitorRegistrationQuerySet.as_manager()
+
+    # Set by callers (API, admin) so the transition log knows who did it.
+    status_changed_by = None
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='exhibitor_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='exhibitor_status_created_idx'),
+            models.Index(
+                OpClass(Upper('company_name'), name='text_pattern_ops'),
+                name='exhibitor_company_upper_idx',
+            ),
+            models.Index(Upper('email_address'), name='exhibitor_email_upper_idx'),
+        ]
 
     def __str__(self):
         return f"{self.company_name} - {self.contact_person_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Not deferred-safe to read `status` here; None means "unknown".
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        previous = getattr(self, '_loaded_status', None)
+
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if adding or (previous is not None and previous != self.status):
+                ExhibitorStatusTransition.objects.create(
+                    registration=self,
+                    from_status='' if adding else previous,
+                    to_status=self.status,
+                    changed_by=self.status_changed_by,
+                )
+
+        self._loaded_status = self.status
+
 
 class VistorRegistration(models.Model):
     First_name = models.CharField(max_length=255)
@@ -43,8 +111,19 @@ class VistorRegistration(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    SEARCH_FIELDS = ('^company_name', '=email_address')
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='visitor_created_idx'),
+            models.Index(fields=['industry', '-created_at'], name='visitor_industry_created_idx'),
+            models.Index(
+                OpClass(Upper('company_name'), name='text_pattern_ops'),
+                name='visitor_company_upper_idx',
+            ),
+            models.Index(Upper('email_address'), name='visitor_email_upper_idx'),
+        ]
 
     def __str__(self):
         return f"{self.First_name} {self.Last_name} - {self.company_name}"
@@ -125,10 +204,65 @@ class CustomUser(AbstractUser):
 # ---------------------------------------------------
 # PASSWORD SETUP TOKEN (expiry: 1 hour)
 # ---------------------------------------------------
+PASSWORD_SETUP_TOKEN_LIFETIME = timedelta(hours=1)
+
+
+def default_token_expiry():
+    return timezone.now() + PASSWORD_SETUP_TOKEN_LIFETIME
+
+
+class PasswordSetupTokenQuerySet(models.QuerySet):
+    def valid(self):
+        return self.filter(expires_at__gt=timezone.now())
+
+    def expired(self):
+        return self.filter(expires_at__lte=timezone.now())
+
+
 class PasswordSetupToken(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     token = models.UUIDField(default=uuid.uuid4, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(default=default_token_expiry, db_index=True)
+    # Set once the invitation email went out; NULL ones are re-sent.
+    invite_sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = PasswordSetupTokenQuerySet.as_manager()
 
     def is_valid(self):
-        return self.created_at >= timezone.now() - timedelta(hours=1)
+        return self.expires_at > timezone.now()
+
+
+# ---------------------------------------------------
+# EXHIBITOR PIPELINE HISTORY (append-only)
+# ---------------------------------------------------
+class ExhibitorStatusTransition(models.Model):
+    registration = models.ForeignKey(
+        ExhibitorRegistration, on_delete=models.CASCADE, related_name='status_transitions'
+    )
+    from_status = models.CharField(max_length=20, blank=True)
+    to_status = models.CharField(max_length=20, choices=ExhibitorRegistration.STATUS_CHOICES)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['changed_at']
+        indexes = [
+            # Rows arrive in time order, so a BRIN index stays tiny and
+            # still prunes range scans as history grows.
+            BrinIndex(fields=['changed_at'], name='transition_changed_brin'),
+            models.Index(fields=['registration', 'changed_at'], name='transition_registration_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.registration_id}: {self.from_status or '-'} -> {self.to_status}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Status transitions are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Status transitions are append-only.")
@@ -0,0 +1,115 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+def estimate_count(queryset):
+    """
+    Row estimate from the PostgreSQL planner instead of a full COUNT(*).
+    Unfiltered querysets read pg_class.reltuples; filtered ones use the
+    top-level row estimate of EXPLAIN. Returns None when no estimate is
+    available (other backends, never-analyzed tables, a failed EXPLAIN),
+    so callers fall back to an exact count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+    # EXPLAIN on a raw cursor: QuerySet.explain() re-serializes the json
+    # column differently depending on the driver.
+    sql, params = queryset.order_by().query.get_compiler(using=queryset.db).as_sql()
+    try:
+        with transaction.atomic(using=queryset.db), connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    except (DatabaseError, LookupError, TypeError, ValueError):
+        return None
+
+
+# -------------------------------------------------------
+# Admin paginator for large tables
+# -------------------------------------------------------
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for big changelists:
+
+    * `count` comes from planner statistics once a table is large enough
+      that COUNT(*) hurts; set `exact = True` to force a real count.
+    * pages past the first seek from a boundary key found with an
+      index-only scan, rather than OFFSET-ing over full rows.
+    """
+
+    estimate_threshold = 10000
+    exact = False
+
+    @cached_property
+    def count(self):
+        if not self.exact:
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        seek = self._seek_ordering()
+        if bottom == 0 or seek is None:
+            # The count may be an estimate, so never clamp the slice to it.
+            object_list = self.object_list[bottom:bottom + self.per_page]
+            return self._get_page(object_list, number, self)
+
+        field, descending = seek
+        boundary = list(self.object_list.values_list(field, 'pk')[bottom:bottom + 1])
+        if not boundary:
+            return self._get_page([], number, self)
+
+        value, pk = boundary[0]
+        if descending:
+            after = Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lte': pk})
+        else:
+            after = Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gte': pk})
+        object_list = self.object_list.filter(after)[:self.per_page]
+        return self._get_page(object_list, number, self)
+
+    def _seek_ordering(self):
+        # Only `<field>, pk` orderings (what the admin builds from a single
+        # sort column) can be turned into a key comparison.
+        order_by = list(self.object_list.query.order_by)
+        if len(order_by) != 2 or not all(isinstance(o, str) for o in order_by):
+            return None
+        field, pk = order_by
+        descending = field.startswith('-')
+        if pk != ('-pk' if descending else 'pk'):
+            return None
+        field = field.lstrip('-')
+        if '__' in field or field == 'pk':
+            return None
+        return field, descending
+
+
+# -------------------------------------------------------
+# API paginators
+# -------------------------------------------------------
+class TeamPagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,43 @@
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    # Anything the fast encoders don't know (Decimal, lazy strings, UUIDs for
+    # msgpack, ...) goes through DRF's own encoder so output matches JSONRenderer.
+    return _fallback_encoder.default(obj)
+
+
+# -------------------------------------------------------
+# JSON via orjson (drop-in for DRF's JSONRenderer)
+# -------------------------------------------------------
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_NON_STR_KEYS
+        # The browsable API (and `Accept: ...; indent=N`) ask for indented
+        # output; orjson only does two spaces.
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+
+
+# -------------------------------------------------------
+# MessagePack (opt-in with Accept: application/msgpack)
+# -------------------------------------------------------
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_default, use_bin_type=True)
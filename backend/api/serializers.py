@@ -2,7 +2,59 @@ from rest_framework import serializers
 from .models import *
 
 
-class ExhibitorRegistrationSerializer(serializers.ModelSerializer):
+def parse_field_list(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+class SparseFieldsetMixin:
+    """
+    Lets list/detail GETs trim the response with `?fields=a,b` or `?omit=c`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+
+        requested = parse_field_list(request.query_params.get('fields'))
+        omitted = parse_field_list(request.query_params.get('omit'))
+
+        unknown = sorted(set(requested + omitted) - set(self.fields))
+        if unknown:
+            raise serializers.ValidationError(
+                {'fields': [f"Unknown field(s): {', '.join(unknown)}"]}
+            )
+
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+        for name in omitted:
+            self.fields.pop(name)
+
+    def selected_columns(self):
+        """
+        Model columns backing the remaining fields, for `.only()`.
+        Returns None when the request did not ask for a sparse fieldset.
+        """
+        request = self.context.get('request')
+        if request is None or not (
+            request.query_params.get('fields') or request.query_params.get('omit')
+        ):
+            return None
+
+        concrete = {f.name for f in self.Meta.model._meta.concrete_fields}
+        columns = {'id'}
+        for field in self.fields.values():
+            if field.source == '*':
+                continue
+            root = field.source.split('.')[0]
+            if root in concrete:
+                columns.add(root)
+        return sorted(columns)
+
+
+class ExhibitorRegistrationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = ExhibitorRegistration
         fields = '__all__'
@@ -21,7 +73,7 @@ class ExhibitorRegistrationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Contact number must be at least 10 digits")
         return value
     
-class VisitorRegistrationSerializer(serializers.ModelSerializer):
+class VisitorRegistrationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
   
     first_name = serializers.CharField(source='First_name')
     last_name = serializers.CharField(source='Last_name')
@@ -50,7 +102,7 @@ class VisitorRegistrationSerializer(serializers.ModelSerializer):
         return value
     
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     # image_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -58,14 +110,20 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'icon', 'image', 'created_at', 'updated_at']
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = '__all__'
 
-class GalleryImageSerializer(serializers.ModelSerializer):
+class GalleryImageSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     # image_url = serializers.SerializerMethodField()
 
     class Meta:
         model = GalleryImage
         fields = ['id', 'title', 'description', 'image', 'created_at', 'updated_at']
+
+
+class TeamInviteSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255)
+    email = serializers.EmailField(max_length=150)
+    role = serializers.ChoiceField(choices=["manager", "sales"])
@@ -0,0 +1,8 @@
+from django.db.models.signals import post_delete, post_save
+
+from .models import Category, Event, GalleryImage
+from .site_bundle import invalidate_site_bundle
+
+for model in (Event, Category, GalleryImage):
+    post_save.connect(invalidate_site_bundle, sender=model, dispatch_uid=f'site-bundle-save-{model.__name__}')
+    post_delete.connect(invalidate_site_bundle, sender=model, dispatch_uid=f'site-bundle-delete-{model.__name__}')
@@ -0,0 +1,110 @@
+import uuid
+from datetime import datetime, time, timedelta
+
+import orjson
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Category, Event, GalleryImage
+from .serializers import CategorySerializer, EventSerializer, GalleryImageSerializer
+
+SITE_BUNDLE_CACHE_KEY = 'site-bundle'
+SITE_BUNDLE_VERSION_KEY = 'site-bundle:version'
+SITE_BUNDLE_FILE = 'site/site-bundle.json'
+SITE_BUNDLE_GALLERY_SIZE = 12
+
+# Upper bound even when no event is about to expire, so date-driven
+# changes are picked up without a model save.
+SITE_BUNDLE_MAX_AGE = timedelta(days=1)
+
+
+def build_site_bundle():
+    """
+    Everything the public pages need in one payload: active upcoming
+    events, all categories and the latest gallery images.
+    Returns (json_bytes, seconds_until_stale).
+    """
+    now = timezone.now()
+    today = timezone.localdate(now)
+
+    events = list(Event.objects.filter(is_active=True, end_date__gte=today).order_by('start_date'))
+    categories = Category.objects.order_by('-created_at')
+    gallery = GalleryImage.objects.order_by('-created_at')[:SITE_BUNDLE_GALLERY_SIZE]
+
+    # The bundle goes stale when the first listed event ends (midnight
+    # after its end_date), or after SITE_BUNDLE_MAX_AGE at the latest.
+    stale_at = now + SITE_BUNDLE_MAX_AGE
+    if events:
+        first_end = min(event.end_date for event in events) + timedelta(days=1)
+        stale_at = min(stale_at, timezone.make_aware(datetime.combine(first_end, time.min)))
+
+    payload = orjson.dumps({
+        'generated_at': now.isoformat(),
+        'stale_at': stale_at.isoformat(),
+        'events': EventSerializer(events, many=True).data,
+        'categories': CategorySerializer(categories, many=True).data,
+        'gallery': GalleryImageSerializer(gallery, many=True).data,
+    })
+    return payload, max(int((stale_at - now).total_seconds()), 1)
+
+
+def cache_is_shared():
+    """False when the cache lives inside this process, so other workers never see its writes."""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def publish_site_bundle(payload):
+    """Overwrite the static JSON file on storage with `payload`."""
+    save_mutable = getattr(default_storage, 'save_mutable', None)
+    if save_mutable is not None:
+        return save_mutable(SITE_BUNDLE_FILE, ContentFile(payload))
+    # Other storages rename on collision; free the key first so the file
+    # keeps its fixed, well-known name.
+    default_storage.delete(SITE_BUNDLE_FILE)
+    return default_storage.save(SITE_BUNDLE_FILE, ContentFile(payload))
+
+
+# The bundle is cached under a version token that every change replaces. A rebuild
+# stores its payload under the version it read *before* querying, so one
+# that overlaps a change lands on a key nobody reads any more, instead of
+# re-caching the old rows until stale_at.
+def _site_bundle_version():
+    return cache.get_or_set(SITE_BUNDLE_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def _site_bundle_key(version):
+    return f'{SITE_BUNDLE_CACHE_KEY}:{version}'
+
+
+def refresh_site_bundle(publish=False):
+    """Rebuild the cached bundle; with publish=True also write the static JSON file."""
+    version = _site_bundle_version()
+    payload, timeout = build_site_bundle()
+    cache.set(_site_bundle_key(version), payload, timeout)
+    if publish:
+        # The static file has no version check: one built just before a
+        # change is corrected by the next scheduled build_site_bundle run.
+        publish_site_bundle(payload)
+    return payload
+
+
+def get_site_bundle():
+    """Cached bundle bytes; rebuilt on a miss (after a change or once stale)."""
+    payload = cache.get(_site_bundle_key(_site_bundle_version()))
+    if payload is None:
+        payload = refresh_site_bundle()
+    return payload
+
+
+def bump_site_bundle_version():
+    cache.set(SITE_BUNDLE_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_site_bundle(**kwargs):
+    # After commit, so the rebuild that follows sees the new rows.
+    transaction.on_commit(bump_site_bundle_version)
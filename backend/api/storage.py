@@ -0,0 +1,123 @@
+import hashlib
+import posixpath
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+from django.utils.encoding import filepath_to_uri
+from django.utils.functional import cached_property
+from storages.utils import clean_name
+
+
+# -------------------------------------------------------
+# Content-addressed media on S3
+# -------------------------------------------------------
+@deconstructible
+class ContentAddressedS3Storage(Storage):
+    """
+    Names every upload `<upload_to>/<sha256><ext>`.
+
+    A key always maps to the same bytes, so objects can be cached forever
+    by browsers and CloudFront, and re-uploading an identical file reuses
+    the existing object instead of storing a second copy. Objects no
+    longer referenced by any row are removed by `manage.py gc_media`.
+
+    The S3 backend (and with it boto3/botocore) is only built on the first
+    call that really talks to S3; `url()` is served from MEDIA_URL, so
+    rendering image URLs never pays for it.
+    """
+
+    object_parameters = {
+        "CacheControl": "public, max-age=31536000, immutable",
+    }
+
+    def __init__(self, **options):
+        self.options = options
+
+    @cached_property
+    def backend(self):
+        from storages.backends.s3 import S3Storage
+
+        options = {
+            "file_overwrite": True,
+            "object_parameters": self.object_parameters,
+            **self.options,
+        }
+        return S3Storage(**options)
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        name = self.hashed_name(name, content)
+        if self.exists(name):
+            self.touch(name)
+            return name
+        return self.backend.save(name, content, max_length=max_length)
+
+    def touch(self, name):
+        """
+        Bump LastModified on a dedup hit with a copy-in-place, so an old
+        orphaned object that is referenced again falls inside gc_media's
+        --min-age-hours grace period.
+        """
+        obj = self.backend.bucket.Object(self.backend._normalize_name(clean_name(name)))
+        obj.copy_from(
+            CopySource={"Bucket": obj.bucket_name, "Key": obj.key},
+            MetadataDirective="REPLACE",
+            ContentType=obj.content_type,
+            Metadata=obj.metadata,
+            **self.object_parameters,
+        )
+
+    def hashed_name(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+
+        directory, filename = posixpath.split(name)
+        ext = posixpath.splitext(filename)[1].lower()
+        return posixpath.join(directory, digest.hexdigest() + ext)
+
+    def save_mutable(self, name, content, cache_control="public, max-age=60"):
+        """
+        Write `content` under a fixed key, overwriting it, for files that are
+        republished in place (e.g. the site bundle). These skip content
+        addressing and get a short Cache-Control instead of `immutable`.
+        """
+        from storages.backends.s3 import S3Storage
+
+        options = {
+            **self.options,
+            "file_overwrite": True,
+            "object_parameters": {"CacheControl": cache_control},
+        }
+        return S3Storage(**options).save(name, content)
+
+    def url(self, name):
+        # Public bucket behind AWS_S3_CUSTOM_DOMAIN, no querystring auth:
+        # the URL is a pure function of the key.
+        return urljoin(settings.MEDIA_URL, filepath_to_uri(name))
+
+    def _open(self, name, mode="rb"):
+        return self.backend.open(name, mode)
+
+    def delete(self, name):
+        return self.backend.delete(name)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
@@ -0,0 +1,105 @@
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .admin import IndustryListFilter
+from .models import Category, ExhibitorRegistration, VistorRegistration
+from .pagination import EstimatedCountPaginator, estimate_count
+from .renderers import ORJSONRenderer
+from .site_bundle import build_site_bundle, get_site_bundle, refresh_site_bundle
+
+
+@skipUnless(connection.vendor == 'postgresql', "Estimated counts need PostgreSQL")
+class EstimatedCountChangelistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        for i in range(3):
+            ExhibitorRegistration.objects.create(
+                status='pending' if i else 'paid',
+                company_name=f'Acme {i}',
+                contact_person_name='Jane',
+                designation='CEO',
+                email_address=f'jane{i}@example.com',
+                contact_number='123',
+                product_service='Rugs',
+                company_address='Street 1',
+            )
+            VistorRegistration.objects.create(
+                First_name='John',
+                Last_name='Doe',
+                company_name=f'Buyer {i}',
+                email_address=f'john{i}@example.com',
+                contact_number='123',
+                industry='Textiles',
+            )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_estimate_for_filtered_queryset(self):
+        estimate = estimate_count(ExhibitorRegistration.objects.filter(status='pending'))
+        self.assertIsInstance(estimate, int)
+
+    def test_failed_explain_falls_back_to_exact_count(self):
+        def fail_explain(execute, sql, params, many, context):
+            if sql.startswith('EXPLAIN'):
+                raise DatabaseError('explain failed')
+            return execute(sql, params, many, context)
+
+        queryset = VistorRegistration.objects.filter(industry='Textiles')
+        with connection.execute_wrapper(fail_explain):
+            self.assertIsNone(estimate_count(queryset))
+            paginator = EstimatedCountPaginator(queryset.order_by('-created_at', '-pk'), 10)
+            paginator.estimate_threshold = 0
+            self.assertEqual(paginator.count, 3)
+
+    def test_industry_choices_are_cached(self):
+        cache.delete(IndustryListFilter.cache_key)
+        self.client.get('/admin/api/vistorregistration/')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/api/vistorregistration/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any('industry' in q['sql'] and 'GROUP BY' in q['sql'] for q in queries.captured_queries))
+        self.assertEqual(cache.get(IndustryListFilter.cache_key), ['Textiles'])
+
+    @mock.patch.object(EstimatedCountPaginator, 'estimate_threshold', 0)
+    def test_filtered_changelists(self):
+        urls = [
+            '/admin/api/exhibitorregistration/?status__exact=pending',
+            '/admin/api/exhibitorregistration/?created_at__gte=2000-01-01',
+            '/admin/api/exhibitorregistration/?q=acme',
+            '/admin/api/vistorregistration/?industry=Textiles',
+            '/admin/api/vistorregistration/?q=buyer&exact_count=1',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertIsInstance(response.context['cl'].paginator, EstimatedCountPaginator)
+
+
+class SiteBundleTests(TestCase):
+    def test_rebuild_overlapping_a_change_is_not_served(self):
+        def build_then_change():
+            built = build_site_bundle()
+            # Committed after the rebuild read its rows, before it caches them.
+            with self.captureOnCommitCallbacks(execute=True):
+                Category.objects.create(name='Ceramics', description='', icon='C')
+            return built
+
+        with mock.patch('api.site_bundle.build_site_bundle', build_then_change):
+            self.assertNotIn(b'Ceramics', refresh_site_bundle())
+        self.assertIn(b'Ceramics', get_site_bundle())
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_indent_requested_by_browsable_api(self):
+        renderer = ORJSONRenderer()
+        self.assertEqual(renderer.render({'a': 1}), b'{"a":1}')
+        self.assertEqual(renderer.render({'a': 1}, 'application/json', {'indent': 4}), b'{\n  "a": 1\n}')
+        self.assertEqual(renderer.render({'a': 1}, 'application/json; indent=4', {}), b'{\n  "a": 1\n}')
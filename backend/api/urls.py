@@ -2,13 +2,17 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     AdminTokenObtainPairView,
+    readiness_view,
     create_admin_user,
     create_team_user,
+    bulk_create_team_users,
     list_team_users,
     delete_team_user,
     send_otp,
     verify_otp,
     create_password,
+    exhibitor_funnel_view,
+    site_bundle,
 
     ExhibitorRegistrationViewSet,
     VisitorRegistrationViewSet,
@@ -26,6 +30,9 @@ router.register(r'events', EventViewSet, basename='event')
 router.register(r'gallery', GalleryImageViewSet, basename='gallery')
 
 urlpatterns = [
+    # Health
+    path('api/health/ready/', readiness_view),
+
     # JWT
     path('api/token/', AdminTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view()),
@@ -35,6 +42,7 @@ urlpatterns = [
 
     # Team management
     path('api/team/create/', create_team_user),
+    path('api/team/bulk-create/', bulk_create_team_users),
     path('api/team/list/', list_team_users),
     path('api/team/delete/<int:user_id>/', delete_team_user),
 
@@ -43,5 +51,11 @@ urlpatterns = [
     path('api/password/verify-otp/', verify_otp),
     path('api/password/create/', create_password),
 
+    # Public homepage payload
+    path('api/site-bundle/', site_bundle),
+
+    # Analytics
+    path('api/analytics/exhibitor-funnel/', exhibitor_funnel_view),
+
     path('api/', include(router.urls)),
 ]
@@ -1,11 +1,14 @@
-from rest_framework import viewsets, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework import viewsets, permissions, filters
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
 from django.core.mail import send_mail
+from django.http import HttpResponse
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
 from rest_framework_simplejwt.views import TokenObtainPairView
 
@@ -23,9 +26,16 @@ from .serializers import (
     CategorySerializer,
     EventSerializer,
     GalleryImageSerializer,
+    TeamInviteSerializer,
 )
 from .utils import CustomTokenObtainPairSerializer
+from .invitations import deliver_invitations, enqueue_invitations
+from .analytics import default_funnel_window, exhibitor_funnel
+from .health import readiness
+from .site_bundle import get_site_bundle
+from .pagination import TeamPagination
 import random
+from datetime import date
 
 
 User = get_user_model()
@@ -38,6 +48,20 @@ class AdminTokenObtainPairView(TokenObtainPairView):
     permission_classes = [AllowAny]
 
 
+# -------------------------------
+# Readiness probe (DB, cache, storage)
+# -------------------------------
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def readiness_view(request):
+    ok, checks = readiness()
+    return Response(
+        {"status": "ok" if ok else "unavailable", "checks": checks},
+        status=200 if ok else 503,
+    )
+
+
 # -------------------------------
 # Optional: Create admin user
 # -------------------------------
@@ -91,23 +115,96 @@ def create_team_user(request):
     # Create token for password setup
     token_obj = PasswordSetupToken.objects.create(user=user)
 
-    # Send email with setup link
-    setup_link = f"https://yourdomain.com/create-password?token={token_obj.token}"
-    send_mail(
-        "Set Your Password",
-        f"Hello {name},\nUse the link below to set your password:\n{setup_link}\n(This link expires in 1 hour.)",
-        "no-reply@yourapp.com",
-        [email]
-    )
+    # Send email with setup link (failures are logged and retried by resend_invites)
+    sent = deliver_invitations([token_obj])
 
     return Response({
-        "message": "Team member created & invitation email sent",
+        "message": "Team member created & invitation email sent" if sent
+        else "Team member created; invitation email will be retried",
         "email": email,
         "role": role,
         "status": "inactive"
     })
 
 
+# -------------------------------------------------------
+# ADMIN: Bulk invite team members
+# -------------------------------------------------------
+BULK_INVITE_LIMIT = 100
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_create_team_users(request):
+    admin = request.user
+
+    if admin.role != "admin":
+        return Response({"detail": "Only admin can create team members."}, status=403)
+
+    members = request.data.get("members")
+    if not isinstance(members, list) or not members:
+        return Response({"detail": "members must be a non-empty list"}, status=400)
+    if len(members) > BULK_INVITE_LIMIT:
+        return Response({"detail": f"At most {BULK_INVITE_LIMIT} members per request"}, status=400)
+
+    # Validate every entry first, so only well-formed strings reach the
+    # duplicate checks below.
+    valid, skipped = [], []
+    for member in members:
+        serializer = TeamInviteSerializer(data=member if isinstance(member, dict) else {})
+        if serializer.is_valid():
+            valid.append(serializer.validated_data)
+        else:
+            email = member.get("email") if isinstance(member, dict) else None
+            skipped.append({
+                "email": email if isinstance(email, str) else None,
+                "reason": serializer.errors,
+            })
+
+    emails = [m["email"] for m in valid]
+    taken = set()
+    for existing in (
+        User.objects.filter(Q(email__in=emails) | Q(username__in=emails))
+        .values_list("email", "username")
+    ):
+        taken.update(existing)
+
+    to_create, seen = [], set()
+    for member in valid:
+        email = member["email"]
+        if email in taken or email in seen:
+            skipped.append({"email": email, "reason": "User already exists"})
+            continue
+        seen.add(email)
+        to_create.append(User(
+            username=email,
+            email=email,
+            name=member["name"],
+            role=member["role"],
+            is_active=False,
+            is_password_set=False
+        ))
+
+    try:
+        with transaction.atomic():
+            users = User.objects.bulk_create(to_create)
+            tokens = PasswordSetupToken.objects.bulk_create(
+                [PasswordSetupToken(user=u) for u in users]
+            )
+            enqueue_invitations(tokens)
+    except IntegrityError:
+        # A concurrent invite created one of these users first; nothing was saved.
+        return Response(
+            {"detail": "Some of these users were just created by another request. Please retry."},
+            status=409,
+        )
+
+    return Response({
+        "message": f"{len(users)} team member(s) created & invitation emails queued",
+        "created": [{"email": u.email, "role": u.role, "status": "inactive"} for u in users],
+        "skipped": skipped,
+    }, status=201 if users else 200)
+
+
 # -------------------------------------------------------
 # GET TEAM LIST
 # -------------------------------------------------------
@@ -119,17 +216,24 @@ def list_team_users(request):
     if admin.role != "admin":
         return Response({"detail": "Only admin can view team."}, status=403)
 
-    users = User.objects.filter(role__in=["manager", "sales"])
+    users = (
+        User.objects.filter(role__in=["manager", "sales"])
+        .order_by("id")
+        .values("id", "name", "email", "role", "is_password_set")
+    )
+
+    paginator = TeamPagination()
+    page = paginator.paginate_queryset(users, request)
 
     data = [{
-        "id": u.id,
-        "name": u.name,
-        "email": u.email,
-        "role": u.role,
-        "status": "active" if u.is_password_set else "inactive"
-    } for u in users]
+        "id": u["id"],
+        "name": u["name"],
+        "email": u["email"],
+        "role": u["role"],
+        "status": "active" if u["is_password_set"] else "inactive"
+    } for u in page]
 
-    return Response(data)
+    return paginator.get_paginated_response(data)
 
 
 # -------------------------------------------------------
@@ -169,9 +273,9 @@ def send_otp(request):
     if not (email and token):
         return Response({"detail": "Email and token are required."}, status=400)
 
-    # Validate token
+    # Validate token (expiry checked in SQL)
     try:
-        token_obj = PasswordSetupToken.objects.get(token=token)
+        token_obj = PasswordSetupToken.objects.valid().select_related("user").get(token=token)
     except PasswordSetupToken.DoesNotExist:
         return Response({"detail": "Invalid or expired link."}, status=400)
 
@@ -232,20 +336,17 @@ def create_password(request):
     if OTP_STORE.get(email) != int(otp):
         return Response({"detail": "Invalid OTP"}, status=400)
 
-    # Token must be valid
+    # Token must exist and be unexpired (checked in SQL)
     try:
-        token_obj = PasswordSetupToken.objects.get(token=token)
+        token_obj = PasswordSetupToken.objects.valid().select_related("user").get(token=token)
     except PasswordSetupToken.DoesNotExist:
-        return Response({"detail": "Invalid link"}, status=400)
+        return Response({"detail": "Invalid or expired link"}, status=400)
 
     user = token_obj.user
 
     if user.email != email:
         return Response({"detail": "Email mismatch"}, status=403)
 
-    if not token_obj.is_valid():
-        return Response({"detail": "Token expired"}, status=400)
-
     # Activate user + set password
     user.password = make_password(password)
     user.is_active = True
@@ -259,34 +360,97 @@ def create_password(request):
     return Response({"message": "Password created successfully!"})
 
 
+# -------------------------------------------------------
+# EXHIBITOR FUNNEL ANALYTICS
+# -------------------------------------------------------
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def exhibitor_funnel_view(request):
+    if request.user.role not in ("admin", "manager"):
+        return Response({"detail": "Access denied"}, status=403)
+
+    # Cohort window (YYYY-MM-DD, until exclusive); defaults to the last 90 days.
+    since, until = default_funnel_window()
+    try:
+        if request.query_params.get("since"):
+            since = date.fromisoformat(request.query_params["since"])
+        if request.query_params.get("until"):
+            until = date.fromisoformat(request.query_params["until"])
+    except ValueError:
+        return Response({"detail": "since/until must be YYYY-MM-DD dates"}, status=400)
+
+    if since >= until:
+        return Response({"detail": "since must be before until"}, status=400)
+
+    return Response(exhibitor_funnel(since, until))
+
+
+# -------------------------------------------------------
+# PUBLIC SITE BUNDLE (events + categories + gallery)
+# -------------------------------------------------------
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def site_bundle(request):
+    # Pre-rendered JSON straight from the cache: no queries, no serializers.
+    response = HttpResponse(get_site_bundle(), content_type="application/json")
+    response["Cache-Control"] = "public, max-age=60"
+    return response
+
+
+# -------------------------------------------------------
+# Sparse fieldsets: narrow the SELECT to ?fields= / ?omit=
+# -------------------------------------------------------
+class SparseFieldsetViewMixin:
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve'):
+            return queryset
+
+        columns = self.get_serializer().selected_columns()
+        if columns:
+            queryset = queryset.only(*columns)
+        return queryset
+
+
 # -------------------------------------------------------
 # Existing CRUD APIs (leave unchanged)
 # -------------------------------------------------------
-class ExhibitorRegistrationViewSet(viewsets.ModelViewSet):
+class ExhibitorRegistrationViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = ExhibitorRegistration.objects.all().order_by('-created_at')
+    filter_backends = [filters.SearchFilter]
+    search_fields = ExhibitorRegistration.SEARCH_FIELDS
     serializer_class = ExhibitorRegistrationSerializer
     permission_classes = [AllowAny]
 
+    def perform_update(self, serializer):
+        # Attribute the status change in the transition log.
+        if self.request.user.is_authenticated:
+            serializer.instance.status_changed_by = self.request.user
+        serializer.save()
+
 
-class VisitorRegistrationViewSet(viewsets.ModelViewSet):
+class VisitorRegistrationViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = VistorRegistration.objects.all().order_by('-created_at')
+    filter_backends = [filters.SearchFilter]
+    search_fields = VistorRegistration.SEARCH_FIELDS
     serializer_class = VisitorRegistrationSerializer
     permission_classes = [AllowAny]
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     parser_classes = (MultiPartParser, FormParser)
     queryset = Category.objects.all().order_by('-created_at')
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all().order_by('-start_date')
     serializer_class = EventSerializer
     permission_classes = [AllowAny]
 
 
-class GalleryImageViewSet(viewsets.ModelViewSet):
+class GalleryImageViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = GalleryImage.objects.all().order_by('-created_at')
     serializer_class = GalleryImageSerializer
     permission_classes = [AllowAny]
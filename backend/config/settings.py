@@ -27,6 +27,8 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    # Needed for OpClass() in the registration search indexes.
+    'django.contrib.postgres',
 
     'rest_framework',
     'rest_framework_simplejwt',
@@ -43,6 +45,10 @@ AUTH_USER_MODEL = 'api.CustomUser'
 # -----------------------------
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+
+    # Brotli / gzip response compression
+    'api.middleware.CompressionMiddleware',
+
     'django.contrib.sessions.middleware.SessionMiddleware',
 
     # CORS
@@ -91,9 +97,39 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
         'PORT': config('DB_PORT', default='5432'),
+        # Keep connections across requests so the warm-up connection is reused.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# -----------------------------
+# CACHE (shared by all workers)
+# -----------------------------
+# The site bundle, analytics and readiness results are written by one
+# process (a worker, cron) and read by the others, so the cache must be
+# shared: Redis/ElastiCache when REDIS_URL is set, otherwise the database
+# (`python manage.py createcachetable`).
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
+# Pre-open DB connections and prime caches when a worker boots (config/wsgi.py).
+WARM_UP_ON_START = config('WARM_UP_ON_START', default=True, cast=bool)
+
 # -----------------------------
 # PASSWORD VALIDATION
 # -----------------------------
@@ -143,8 +179,17 @@ AWS_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=86400",
 }
 
-# Use S3 for uploaded media
-DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
+# Use S3 for uploaded media. Keys are content hashes, so the media
+# storage overrides the Cache-Control above with `immutable`.
+# (DEFAULT_FILE_STORAGE is no longer read since Django 5.1.)
+STORAGES = {
+    "default": {
+        "BACKEND": "api.storage.ContentAddressedS3Storage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
 
 # Media URL served from S3
 MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/{AWS_LOCATION}/"
@@ -159,6 +204,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.ORJSONRenderer',
+        'api.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
 }
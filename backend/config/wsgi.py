@@ -1,6 +1,11 @@
 import os
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+if settings.WARM_UP_ON_START:
+    from api.health import warm_up
+    warm_up()
\ No newline at end of file
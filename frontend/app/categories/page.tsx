@@ -1,10 +1,11 @@
 "use client";
 
 import Image from "next/image";
-import { useEffect, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { Navbar } from "@/components/navbar";
 import { Footer } from "@/components/footer";
 import { ChatBot } from "@/components/chat-bot";
+import { useSiteBundle } from "@/hooks/useSiteBundle";
 
 interface CategoryData {
   id: number;
@@ -13,63 +14,29 @@ interface CategoryData {
   icon: string;
 }
 
-const CATEGORY_API_URL = "http://localhost:8000/api/categories/";
-
 export default function CategoriesPage() {
-  const [categories, setCategories] = useState<{ name: string; imageUrl: string }[]>([]);
   const [activeIndex, setActiveIndex] = useState(0);
   const [overlayVisible, setOverlayVisible] = useState(false);
 
   /** -------------------------------------------------------
-   *  🔥 FETCH CATEGORIES FROM BACKEND (with pagination fix)
+   *  🔥 CATEGORIES FROM THE SITE BUNDLE
    *  ------------------------------------------------------- */
-  useEffect(() => {
-    const fetchCategories = async () => {
-      try {
-        const response = await fetch(CATEGORY_API_URL, {
-          method: "GET",
-          headers: { Accept: "application/json" },
-        });
-
-        if (!response.ok) {
-          console.error("Failed to load categories");
-          setCategories([]);
-          return;
-        }
-
-        let data = await response.json();
-
-        // Django REST Framework pagination support
-        if (data && data.results) {
-          data = data.results;
-        }
-
-        if (!Array.isArray(data)) {
-          console.error("Category API did not return an array");
-          setCategories([]);
-          return;
-        }
-
-        // Map API data → frontend carousel format
-        const formatted = data.map((cat: CategoryData) => {
-          // convert "Home Décor" → "home-décor.webp"
-          const filename = cat.name.toLowerCase().replace(/ /g, "-") + ".webp";
-
-          return {
-            name: cat.name,
-            imageUrl: `/categories/${filename}`, // must exist in public/categories/
-          };
-        });
-
-        setCategories(formatted);
-      } catch (error) {
-        console.error("Category fetch error:", error);
-        setCategories([]);
-      }
-    };
-
-    fetchCategories();
-  }, []);
+  const { bundle } = useSiteBundle();
+
+  // Map API data → frontend carousel format
+  const categories = useMemo(
+    () =>
+      (bundle?.categories ?? []).map((cat: CategoryData) => {
+        // convert "Home Décor" → "home-décor.webp"
+        const filename = cat.name.toLowerCase().replace(/ /g, "-") + ".webp";
+
+        return {
+          name: cat.name,
+          imageUrl: `/categories/${filename}`, // must exist in public/categories/
+        };
+      }),
+    [bundle]
+  );
 
   /** Auto slide animation */
   useEffect(() => {
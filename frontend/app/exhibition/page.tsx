@@ -5,6 +5,7 @@ import { Navbar } from "@/components/navbar";
 import { ChatBot } from "@/components/chat-bot";
 import { Calendar, Clock, MapPin } from "lucide-react";
 import { useSearchParams } from "next/navigation"; // Added for hash handling
+import { useSiteBundle } from "@/hooks/useSiteBundle";
 
 interface FormData {
   company_name: string;
@@ -33,7 +34,6 @@ interface EventData {
 
 const BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
 const API_URL = `${BASE_URL}/exhibitor-registrations/`;
-const EVENTS_API_URL = `${BASE_URL}/events/`;
 
 export default function ExhibitionPage() {
   const [formData, setFormData] = useState<FormData>({
@@ -46,9 +46,10 @@ export default function ExhibitionPage() {
     company_address: "",
   });
 
-  const [events, setEvents] = useState<EventData[]>([]);
+  // The bundle only holds active events that haven't ended yet.
+  const { bundle, loading: loadingEvents } = useSiteBundle();
+  const events: EventData[] = bundle?.events ?? [];
   const [isSubmitting, setIsSubmitting] = useState(false);
-  const [loadingEvents, setLoadingEvents] = useState(true);
   const [message, setMessage] = useState<{ type: "success" | "error"; text: string } | null>(null);
 
   // ------------------------------------------------------------------
@@ -67,46 +68,6 @@ export default function ExhibitionPage() {
     }
   }, [loadingEvents]); // Re-run check after events load (which changes page height)
 
-
-  useEffect(() => {
-    const fetchEvents = async () => {
-      try {
-        setLoadingEvents(true);
-
-        const response = await fetch(EVENTS_API_URL, {
-          method: "GET",
-          headers: { Accept: "application/json" },
-        });
-
-        if (!response.ok) {
-          setEvents([]);
-          return;
-        }
-
-        let data = await response.json();
-
-        if (data && data.results) {
-          data = data.results;
-        }
-
-        if (!Array.isArray(data)) {
-          setEvents([]);
-          return;
-        }
-
-        const activeEvents = data.filter((ev: EventData) => ev.is_active === true);
-        setEvents(activeEvents);
-      } catch (error) {
-        console.error("Error fetching events:", error);
-        setEvents([]);
-      } finally {
-        setLoadingEvents(false);
-      }
-    };
-
-    fetchEvents();
-  }, []);
-
   const handleChange = (e: any) => {
     const { name, value } = e.target;
     setFormData((prev) => ({
@@ -1,55 +1,25 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import Image from "next/image";
 import { Navbar } from "@/components/navbar";
 import { ChatBot } from "@/components/chat-bot";
 import { Footer } from "@/components/footer";
-
-const GALLERY_API_URL = "http://localhost:8000/api/gallery/";
+import { useSiteBundle } from "@/hooks/useSiteBundle";
 
 interface GalleryItem {
   id: number;
   title: string;
   description: string;
-  image_url: string;
+  image: string;
 }
 
 export default function GalleryPage() {
-  const [gallery, setGallery] = useState<GalleryItem[]>([]);
-  const [loading, setLoading] = useState(true);
   const [selectedImage, setSelectedImage] = useState<string | null>(null);
 
-  // Fetch gallery images from API
-  useEffect(() => {
-    const fetchGallery = async () => {
-      try {
-        const res = await fetch(GALLERY_API_URL);
-        if (!res.ok) {
-          console.error("Failed to load gallery:", res.status);
-          return;
-        }
-
-        let data = await res.json();
-
-        // Handle DRF pagination: { results: [...] }
-        if (data && data.results) data = data.results;
-
-        if (!Array.isArray(data)) {
-          console.error("Gallery API did not return a list");
-          return;
-        }
-
-        setGallery(data);
-      } catch (error) {
-        console.error("Gallery fetch error:", error);
-      } finally {
-        setLoading(false);
-      }
-    };
-
-    fetchGallery();
-  }, []);
+  // Latest gallery images, from the site bundle
+  const { bundle, loading } = useSiteBundle();
+  const gallery: GalleryItem[] = bundle?.gallery ?? [];
 
   return (
     <div className="min-h-screen">
@@ -93,11 +63,11 @@ export default function GalleryPage() {
                 {gallery.map((item) => (
                   <div
                     key={item.id}
-                    onClick={() => setSelectedImage(item.image_url)}
+                    onClick={() => setSelectedImage(item.image)}
                     className="aspect-square rounded-lg overflow-hidden shadow hover:scale-105 transition-all duration-500 cursor-pointer"
                   >
                     <Image
-                      src={item.image_url}
+                      src={item.image}
                       alt={item.title}
                       fill
                       className="object-cover"
@@ -0,0 +1,35 @@
+"use client";
+
+import { useState, useEffect } from "react";
+import { SiteBundle, URLS } from "@/utils/api";
+
+// Public pages read events, categories and gallery from one precomputed
+// payload instead of hitting each endpoint. Sent without auth headers so
+// the response stays cacheable and eligible for Brotli.
+export function useSiteBundle() {
+  const [bundle, setBundle] = useState<SiteBundle | null>(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    const fetchBundle = async () => {
+      try {
+        const res = await fetch(URLS.SITE_BUNDLE, {
+          method: "GET",
+          headers: { Accept: "application/json" },
+        });
+
+        if (!res.ok) throw new Error(`Failed to load site bundle: ${res.status}`);
+
+        setBundle(await res.json());
+      } catch (error) {
+        console.error("Site bundle fetch error:", error);
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchBundle();
+  }, []);
+
+  return { bundle, loading };
+}
@@ -27,14 +27,24 @@ export function useTeam() {
     setLoading(true);
 
     try {
-      const res = await fetch(`${BASE_URL}/api/team/list/`, {
-        headers: {
-          Authorization: `Bearer ${localStorage.getItem("access")}`,
-        },
-      });
+      // The list is paginated: follow `next` until every member is loaded.
+      const members: TeamUser[] = [];
+      let url: string | null = `${BASE_URL}/api/team/list/?page_size=100`;
+
+      while (url) {
+        const res: Response = await fetch(url, {
+          headers: {
+            Authorization: `Bearer ${localStorage.getItem("access")}`,
+          },
+        });
+        if (!res.ok) throw new Error(`Team fetch failed: ${res.status}`);
+
+        const data = await res.json();
+        members.push(...(data.results || data));
+        url = data.next || null;
+      }
 
-      const data = await res.json();
-      if (res.ok) setTeam(data);
+      setTeam(members);
     } catch (err) {
       console.log("Team fetch error:", err);
     }
@@ -6,6 +6,7 @@ export const URLS = {
   EVENTS: `${BASE_URL}/events/`,
   CATEGORIES: `${BASE_URL}/categories/`,
   GALLERY: `${BASE_URL}/gallery/`,
+  SITE_BUNDLE: `${BASE_URL}/site-bundle/`,
 };
 
 // --- Helper ---
@@ -74,3 +75,13 @@ export interface GalleryImage {
   image_url: string;
   description: string;
 }
+
+// Payload of /site-bundle/: active upcoming events, all categories and the
+// latest gallery images, serialized as by their own endpoints.
+export interface SiteBundle {
+  generated_at: string;
+  stale_at: string;
+  events: any[];
+  categories: Category[];
+  gallery: any[];
+}